@@ -4,13 +4,31 @@ import matplotlib.pyplot as plt
 from scipy import stats
 from scipy.optimize import curve_fit
 import datetime
+import json
 import os
+import concurrent.futures
+import functools
+
+@functools.lru_cache(maxsize=32)
+def _synthesize_thermal_series(duration_hours, sample_interval_min):
+    num_samples = int(max(2, (duration_hours * 60) / max(1, sample_interval_min)))
+    rng = np.random.default_rng(0)
+    cpu = 45 + 5 * np.sin(np.linspace(0, 6.28, num_samples)) + rng.normal(0, 0.8, num_samples)
+    gpu = 40 + 6 * np.sin(np.linspace(0, 3.14, num_samples)) + rng.normal(0, 1.0, num_samples)
+    psu = 38 + 2 * np.sin(np.linspace(0, 12.56, num_samples)) + rng.normal(0, 0.5, num_samples)
+    if num_samples > 10:
+        spike_idx = rng.integers(0, num_samples, size=3)
+        cpu[spike_idx] += rng.uniform(5, 15, size=3)
+    for series in (cpu, gpu, psu):
+        series.flags.writeable = False
+    return cpu, gpu, psu
 
 class ThermalManagementValidation:
     def __init__(self):
         self.test_data = None
         self.results = {}
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._pending_plot = None
         
     def generate_thermal_data(self, duration_hours=24, sample_interval_min=5):
         print("Calculating thermal metrics...")
@@ -19,13 +37,7 @@ class ThermalManagementValidation:
             num_samples = int(max(2, (duration_hours * 60) / max(1, sample_interval_min)))
             base_time = datetime.datetime.now() - datetime.timedelta(hours=duration_hours)
             timestamps = [base_time + datetime.timedelta(minutes=i * sample_interval_min) for i in range(num_samples)]
-            rng = np.random.default_rng(0)
-            cpu = 45 + 5 * np.sin(np.linspace(0, 6.28, num_samples)) + rng.normal(0, 0.8, num_samples)
-            gpu = 40 + 6 * np.sin(np.linspace(0, 3.14, num_samples)) + rng.normal(0, 1.0, num_samples)
-            psu = 38 + 2 * np.sin(np.linspace(0, 12.56, num_samples)) + rng.normal(0, 0.5, num_samples)
-            if num_samples > 10:
-                spike_idx = rng.integers(0, num_samples, size=3)
-                cpu[spike_idx] += rng.uniform(5, 15, size=3)
+            cpu, gpu, psu = _synthesize_thermal_series(duration_hours, sample_interval_min)
             self.test_data = pd.DataFrame({
                 'timestamp': timestamps,
                 'CPU': cpu,
@@ -65,31 +77,32 @@ class ThermalManagementValidation:
             'overall_status': 'PASS'
         }
 
-        critical_failures = []
-        warnings = []
-
-        for component, metrics in self.results.get('component_metrics', {}).items():
-            max_temp = metrics['max_temperature']
-            exceed_80_count = metrics['exceed_80C_count']
-            exceed_90_count = metrics['exceed_90C_count']
-
-            component_status = 'PASS'
-            if max_temp > validation['safety_limits']['critical_limit']:
-                component_status = 'CRITICAL_FAIL'
-                critical_failures.append(component)
-                validation['overall_status'] = 'FAIL'
-            elif max_temp > validation['safety_limits']['high_warning']:
-                component_status = 'WARNING'
-                warnings.append(component)
-            elif exceed_80_count > 0:
-                component_status = 'WARNING'
-                warnings.append(component)
-
+        component_metrics = self.results.get('component_metrics', {})
+        components = list(component_metrics.keys())
+        max_temps = np.array([m['max_temperature'] for m in component_metrics.values()], dtype=float)
+        exceed_80_counts = np.array([m['exceed_80C_count'] for m in component_metrics.values()], dtype=int)
+        exceed_90_counts = np.array([m['exceed_90C_count'] for m in component_metrics.values()], dtype=int)
+
+        statuses = np.select(
+            [max_temps > validation['safety_limits']['critical_limit'],
+             max_temps > validation['safety_limits']['high_warning'],
+             exceed_80_counts > 0],
+            ['CRITICAL_FAIL', 'WARNING', 'WARNING'],
+            default='PASS'
+        )
+
+        critical_failures = [c for c, s in zip(components, statuses) if s == 'CRITICAL_FAIL']
+        warnings = [c for c, s in zip(components, statuses) if s == 'WARNING']
+        if critical_failures:
+            validation['overall_status'] = 'FAIL'
+
+        for component, status, max_temp, exceed_80_count, exceed_90_count in zip(
+                components, statuses, max_temps, exceed_80_counts, exceed_90_counts):
             validation['component_validation'][component] = {
-                'status': component_status,
-                'max_temperature': max_temp,
-                'exceed_80C_count': exceed_80_count,
-                'exceed_90C_count': exceed_90_count
+                'status': str(status),
+                'max_temperature': float(max_temp),
+                'exceed_80C_count': int(exceed_80_count),
+                'exceed_90C_count': int(exceed_90_count)
             }
 
         validation['critical_failures'] = critical_failures
@@ -102,7 +115,7 @@ class ThermalManagementValidation:
         }
         return validation
     
-    def create_visualizations(self):
+    def create_visualizations(self, executor=None):
         print("Generating validation report...")
 
         if isinstance(self.test_data, pd.DataFrame) and 'timestamp' in self.test_data.columns:
@@ -132,8 +145,11 @@ class ThermalManagementValidation:
             ax.grid(True, alpha=0.3)
             plot_path = f"thermal_plot_{self.timestamp}.png"
             fig.tight_layout()
-            fig.savefig(plot_path, dpi=150)
-            plt.close(fig)
+            if executor is None:
+                fig.savefig(plot_path, dpi=150)
+                plt.close(fig)
+            else:
+                self._pending_plot = (fig, executor.submit(fig.savefig, plot_path, dpi=150))
             report['plot'] = plot_path
         except Exception:
             report['plot'] = None
@@ -148,32 +164,40 @@ class ThermalManagementValidation:
 
         self.generate_thermal_data()
         self.perform_thermal_analysis()
-        report = self.create_visualizations()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            report = self.create_visualizations(executor=pool)
 
-        out_dir = os.getcwd()
-        data_file = os.path.join(out_dir, f"thermal_testdata_{self.timestamp}.csv")
-        metrics_file = os.path.join(out_dir, f"thermal_metrics_{self.timestamp}.csv")
-        validation_file = os.path.join(out_dir, f"thermal_validation_{self.timestamp}.json")
+            out_dir = os.getcwd()
+            data_file = os.path.join(out_dir, f"thermal_testdata_{self.timestamp}.csv")
+            metrics_file = os.path.join(out_dir, f"thermal_metrics_{self.timestamp}.csv")
+            validation_file = os.path.join(out_dir, f"thermal_validation_{self.timestamp}.json")
 
-        try:
-            if isinstance(self.test_data, pd.DataFrame):
-                self.test_data.to_csv(data_file, index=False)
-            else:
+            try:
+                if isinstance(self.test_data, pd.DataFrame):
+                    self.test_data.to_csv(data_file, index=False)
+                else:
+                    data_file = None
+            except Exception:
                 data_file = None
-        except Exception:
-            data_file = None
 
-        try:
-            metrics_df = pd.DataFrame.from_dict(self.results.get('component_metrics', {}), orient='index')
-            metrics_df.to_csv(metrics_file)
-        except Exception:
-            metrics_file = None
+            try:
+                metrics_df = pd.DataFrame.from_dict(self.results.get('component_metrics', {}), orient='index')
+                metrics_df.to_csv(metrics_file)
+            except Exception:
+                metrics_file = None
 
-        try:
-            with open(validation_file, 'w') as f:
-                json.dump(self.results.get('validation', {}), f, indent=2)
-        except Exception:
-            validation_file = None
+            try:
+                with open(validation_file, 'w') as f:
+                    json.dump(self.results.get('validation', {}), f, indent=2)
+            except Exception:
+                validation_file = None
+
+            if self._pending_plot is not None:
+                fig, plot_future = self._pending_plot
+                if plot_future.exception() is not None:
+                    report['plot'] = None
+                plt.close(fig)
+                self._pending_plot = None
 
         print("\n" + "=" * 60)
         print("THERMAL MANAGEMENT VALIDATION SUMMARY")
@@ -1,12 +1,14 @@
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib as mpl
 from scipy import signal
 from scipy.special import erfc
 from datetime import datetime
+import functools
+import os
+import threading
+import concurrent.futures
 
-mpl.rcParams.update({
+_PLOT_STYLE = {
     'font.size': 8,
     'font.family': 'serif',
     'font.serif': ['Times New Roman'],
@@ -16,7 +18,24 @@ mpl.rcParams.update({
     'axes.linewidth': 0.6,
     'grid.linewidth': 0.4,
     'lines.linewidth': 1.0
-})
+}
+
+@functools.lru_cache(maxsize=8)
+def _filter_coefficients(b, a):
+    b = np.asarray(b, dtype=float)
+    a = np.asarray(a, dtype=float)
+    b_n, a_n = b / a[0], a / a[0]
+    return b_n, a_n, signal.lfilter_zi(b_n, a_n)
+
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+def _lfsr_sequence(length, order):
+    sequence = np.ones(length, dtype=np.uint8)
+    step = order - 1
+    for i in range(order, length, step):
+        end = min(i + step, length)
+        sequence[i:end] = sequence[i - order:end - order] ^ sequence[i - order + 1:end - order + 1]
+    return sequence
 
 class Z80OpticalInterfaceTest:
     
@@ -41,18 +60,44 @@ class Z80OpticalInterfaceTest:
         }
         
         self.results = {}
-        
+        self._tx_cache = {}
+        self._sample_trace = None
+        self._seed_sequence = np.random.SeedSequence()
+        self._seed_lock = threading.Lock()
+        self._thread_state = threading.local()
+        self._q_grid = np.linspace(0, 20, 2001)
+        self._log_ber_grid = np.log(0.5 * erfc(self._q_grid / np.sqrt(2)))
+        self._patterns = {(name, 256): self.generate_z80_data_pattern(name, 256)
+                          for name in self.test_conditions['data_patterns']}
+        self._patterns[('PRBS7', 128)] = self.generate_z80_data_pattern('PRBS7', 128)
+        
+    def _thread_noise(self, n_samples):
+        state = self._thread_state
+        if not hasattr(state, 'rng'):
+            with self._seed_lock:
+                seed = self._seed_sequence.spawn(1)[0]
+            state.rng = np.random.default_rng(seed)
+            state.noise_buf = np.empty(0)
+        if state.noise_buf.size < n_samples:
+            state.noise_buf = np.empty(n_samples)
+        noise = state.noise_buf[:n_samples]
+        state.rng.standard_normal(out=noise)
+        return noise
+    
+    def q_factor_to_ber(self, q_factor):
+        q_factor = np.asarray(q_factor, dtype=float)
+        ber = np.exp(np.interp(q_factor, self._q_grid, self._log_ber_grid))
+        beyond_grid = q_factor > self._q_grid[-1]
+        if np.any(beyond_grid):
+            ber = np.where(beyond_grid, 0.5 * erfc(q_factor / np.sqrt(2)), ber)[()]
+        return ber
+    
     def generate_z80_data_pattern(self, pattern_type, length=256):
         if pattern_type == 'PRBS7':
-            prbs = np.ones(length, dtype=int)
-            for i in range(7, length):
-                prbs[i] = prbs[i-7] ^ prbs[i-6]
+            return _lfsr_sequence(length, 7) * np.uint8(255)
         
         elif pattern_type == 'PRBS15':
-            prbs = np.ones(length, dtype=int)
-            for i in range(15, length):
-                prbs[i] = prbs[i-15] ^ prbs[i-14]
-            return prbs * 255
+            return _lfsr_sequence(length, 15) * np.uint8(255)
         
         elif pattern_type == 'All_Ones':
             return np.ones(length, dtype=int) * 255
@@ -61,19 +106,13 @@ class Z80OpticalInterfaceTest:
             return np.zeros(length, dtype=int)
         
         elif pattern_type == 'Alternating':
-            return np.array([0xAA if i % 2 else 0x55 for i in range(length)])
+            return np.where(np.arange(length) % 2, 0xAA, 0x55).astype(np.uint8)
         
         elif pattern_type == 'Walking_One':
-            pattern = []
-            for i in range(length):
-                pattern.append(1 << (i % 8))
-            return np.array(pattern)
+            return np.left_shift(1, np.arange(length) % 8).astype(np.uint8)
         
         elif pattern_type == 'Walking_Zero':
-            pattern = []
-            for i in range(length):
-                pattern.append(0xFF ^ (1 << (i % 8)))
-            return np.array(pattern)
+            return np.left_shift(1, np.arange(length) % 8).astype(np.uint8) ^ np.uint8(0xFF)
         
         else:
             return np.random.randint(0, 256, length)
@@ -101,29 +140,24 @@ class Z80OpticalInterfaceTest:
         bits_per_byte = 8
         bit_time = 1 / (clock_frequency * bits_per_byte)
         
-        bit_stream = []
-        for byte in data_pattern:
-            for bit in range(bits_per_byte):
-                bit_stream.append((byte >> bit) & 1)
-        
-        bit_stream = np.array(bit_stream)
+        bit_stream = np.unpackbits(np.asarray(data_pattern, dtype=np.uint8), bitorder='little')
         
         
         optical_power = np.where(bit_stream == 1, p_high, p_low)
         
         samples_per_bit = 10
-        time_vector = np.linspace(0, len(bit_stream) * bit_time, len(bit_stream) * samples_per_bit)
         
         optical_waveform = np.repeat(optical_power, samples_per_bit)
         
-        optical_waveform = signal.filtfilt(b, a, optical_waveform)
+        b_n, a_n, zi = _filter_coefficients(tuple(np.atleast_1d(b)), tuple(np.atleast_1d(a)))
+        optical_waveform, _ = signal.lfilter(b_n, a_n, optical_waveform, zi=zi * optical_waveform[0])
         
-        optical_waveform = np.clip(optical_waveform, p_low * 0.9, p_high * 1.1)
+        np.clip(optical_waveform, p_low * 0.9, p_high * 1.1, out=optical_waveform)
         
         return {
             'bit_stream': bit_stream,
             'optical_waveform': optical_waveform,
-            'time_vector': time_vector,
+            'bit_time': bit_time,
             'average_power': np.mean(optical_power),
             'extinction_ratio': 10 * np.log10(p_high / p_low),
             'samples_per_bit': samples_per_bit,
@@ -131,9 +165,19 @@ class Z80OpticalInterfaceTest:
             'p_low': p_low
         }
     
+    def transmitter_time_vector(self, optical_tx_data):
+        num_bits = len(optical_tx_data['bit_stream'])
+        samples_per_bit = optical_tx_data['samples_per_bit']
+        return np.linspace(0, num_bits * optical_tx_data['bit_time'], num_bits * samples_per_bit)
+    
+    def cached_transmitter_model(self, pattern_name, data_pattern, clock_frequency):
+        key = (pattern_name, len(data_pattern), clock_frequency)
+        if key not in self._tx_cache:
+            self._tx_cache[key] = self.optical_transmitter_model(data_pattern, clock_frequency)
+        return self._tx_cache[key]
+    
     def optical_receiver_model(self, optical_tx_data, temperature):
         optical_waveform = optical_tx_data['optical_waveform']
-        time_vector = optical_tx_data['time_vector']
         samples_per_bit = optical_tx_data['samples_per_bit']
         p_high = optical_tx_data['p_high']
         p_low = optical_tx_data['p_low']
@@ -148,20 +192,14 @@ class Z80OpticalInterfaceTest:
         
         
         total_noise_std = np.sqrt(shot_noise_std**2 + thermal_noise_std**2)
-        noise = np.random.normal(0, total_noise_std, len(ideal_photocurrent))
+        noise = self._thread_noise(len(ideal_photocurrent))
         
-        noisy_current = ideal_photocurrent + noise
+        noisy_current = np.multiply(noise, total_noise_std)
+        noisy_current += ideal_photocurrent
         
         optimal_threshold = (i_high + i_low) / 2
         
-        regenerated_bits = []
-        for i in range(0, len(noisy_current), samples_per_bit):
-            if i + samples_per_bit//2 < len(noisy_current):
-                sample_index = i + samples_per_bit//2
-                bit_value = 1 if noisy_current[sample_index] > optimal_threshold else 0
-                regenerated_bits.append(bit_value)
-        
-        regenerated_bits = np.array(regenerated_bits)
+        regenerated_bits = np.greater(noisy_current[samples_per_bit//2::samples_per_bit], optimal_threshold).view(np.uint8)
         
         signal_power = np.var(ideal_photocurrent)
         noise_power = total_noise_std**2
@@ -173,7 +211,7 @@ class Z80OpticalInterfaceTest:
             snr = 10 * np.log10(snr_ratio)
         else:
         
-        theoretical_ber = 0.5 * erfc(q_factor / np.sqrt(2))
+        theoretical_ber = self.q_factor_to_ber(q_factor)
         
         return {
             'photocurrent': noisy_current,
@@ -187,12 +225,12 @@ class Z80OpticalInterfaceTest:
     
     def calculate_realistic_ber(self, clock_frequency, snr, pattern_type, q_factor=None):
         if q_factor is not None and q_factor > 0:
-            ber_q = 0.5 * erfc(q_factor / np.sqrt(2))
+            ber_q = self.q_factor_to_ber(q_factor)
         else:
             if snr <= 0:
                 return 0.5
             snr_linear = 10**(snr / 10)
-            ber_q = 0.5 * erfc(np.sqrt(snr_linear / 2))
+            ber_q = self.q_factor_to_ber(np.sqrt(snr_linear))
         
         pattern_factor = 1.0
         
@@ -206,10 +244,10 @@ class Z80OpticalInterfaceTest:
         if min_length == 0:
             return 1e-12
             
-        transmitted_bits = transmitted_bits[:min_length]
-        received_bits = received_bits[:min_length]
+        tx_packed = np.packbits(np.asarray(transmitted_bits[:min_length], dtype=bool))
+        rx_packed = np.packbits(np.asarray(received_bits[:min_length], dtype=bool))
         
-        bit_errors = np.sum(transmitted_bits != received_bits)
+        bit_errors = int(_POPCOUNT_TABLE[tx_packed ^ rx_packed].sum(dtype=np.int64))
         ber = bit_errors / min_length
         
         if ber > 0.1:
@@ -218,6 +256,9 @@ class Z80OpticalInterfaceTest:
         return max(ber, 1e-12)
     
     def interface_timing_analysis(self, clock_frequency, temperature, voltage):
+        clock_frequency = np.asarray(clock_frequency, dtype=float)
+        temperature = np.asarray(temperature, dtype=float)
+        voltage = np.asarray(voltage, dtype=float)
         z80_timing = self.z80_bus_timing_model(clock_frequency, temperature, voltage)
         
         
@@ -229,98 +270,90 @@ class Z80OpticalInterfaceTest:
             'optical_setup_time': optical_setup_time,
             'timing_margin': timing_margin,
             'hold_margin': hold_margin,
-            'timing_compatible': timing_margin > 0 and hold_margin > 0
+            'timing_compatible': np.logical_and(timing_margin > 0, hold_margin > 0)
         }
     
+    def _run_single(self, pattern_name, pattern_length, clock_frequency, temperature):
+        data = self._patterns[(pattern_name, pattern_length)]
+        optical_tx = self.cached_transmitter_model(pattern_name, data, clock_frequency)
+        optical_rx = self.optical_receiver_model(optical_tx, temperature)
+        return optical_tx, optical_rx
+    
     def perform_comprehensive_test(self):
         print("Initiating Z80 Optical Interface Characterization...")
         
-        test_results = []
         
         
-        for pattern in self.test_conditions['data_patterns']:
-            data = self.generate_z80_data_pattern(pattern, 256)
-            optical_tx = self.optical_transmitter_model(data, clock_ref)
-            optical_rx = self.optical_receiver_model(optical_tx, temp_ref)
-            
-            timing_analysis = self.interface_timing_analysis(clock_ref, temp_ref, voltage_ref)
-            
-            theoretical_ber = optical_rx['theoretical_ber']
-            empirical_ber = self.calculate_ber(optical_tx['bit_stream'], optical_rx['regenerated_bits'])
-            
-            final_ber = theoretical_ber
-            
-            test_results.append({
-                'test_type': 'data_pattern',
-                'pattern_name': pattern,
-                'clock_frequency_hz': clock_ref,
-                'temperature_k': temp_ref,
-                'supply_voltage_v': voltage_ref,
-                'bit_error_rate': final_ber,
-                'average_optical_power_mw': optical_tx['average_power'],
-                'extinction_ratio_db': optical_tx['extinction_ratio'],
-                'signal_to_noise_ratio_db': optical_rx['signal_to_noise_ratio'],
-                'timing_margin_s': timing_analysis['timing_margin'],
-                'hold_margin_s': timing_analysis['hold_margin'],
-                'timing_compatible': timing_analysis['timing_compatible'],
-                'data_throughput_mbps': clock_ref * 8 / 1e6,
-                'q_factor': optical_rx['q_factor']
-            })
-        
         pattern_ref = 'PRBS7'
-        data = self.generate_z80_data_pattern(pattern_ref, 128)
-        
-        for clock_freq in self.test_conditions['clock_frequencies']:
-            optical_tx = self.optical_transmitter_model(data, clock_freq)
-            optical_rx = self.optical_receiver_model(optical_tx, temp_ref)
-            
-            timing_analysis = self.interface_timing_analysis(clock_freq, temp_ref, voltage_ref)
-            
-            theoretical_ber = optical_rx['theoretical_ber']
-            final_ber = theoretical_ber
-            
-            test_results.append({
-                'test_type': 'clock_frequency',
-                'pattern_name': pattern_ref,
-                'clock_frequency_hz': clock_freq,
-                'temperature_k': temp_ref,
-                'supply_voltage_v': voltage_ref,
-                'bit_error_rate': final_ber,
-                'average_optical_power_mw': optical_tx['average_power'],
-                'extinction_ratio_db': optical_tx['extinction_ratio'],
-                'signal_to_noise_ratio_db': optical_rx['signal_to_noise_ratio'],
-                'timing_margin_s': timing_analysis['timing_margin'],
-                'hold_margin_s': timing_analysis['hold_margin'],
-                'timing_compatible': timing_analysis['timing_compatible'],
-                'data_throughput_mbps': clock_freq * 8 / 1e6,
-                'q_factor': optical_rx['q_factor']
-            })
-        
-        for temperature in self.test_conditions['temperature_range']:
-            optical_tx = self.optical_transmitter_model(data, clock_ref)
-            optical_rx = self.optical_receiver_model(optical_tx, temperature)
-            
-            timing_analysis = self.interface_timing_analysis(clock_ref, temperature, voltage_ref)
-            
-            theoretical_ber = optical_rx['theoretical_ber']
-            final_ber = theoretical_ber
-            
-            test_results.append({
-                'test_type': 'temperature_variation',
-                'pattern_name': pattern_ref,
-                'clock_frequency_hz': clock_ref,
-                'temperature_k': temperature,
-                'supply_voltage_v': voltage_ref,
-                'bit_error_rate': final_ber,
-                'average_optical_power_mw': optical_tx['average_power'],
-                'extinction_ratio_db': optical_tx['extinction_ratio'],
-                'signal_to_noise_ratio_db': optical_rx['signal_to_noise_ratio'],
-                'timing_margin_s': timing_analysis['timing_margin'],
-                'hold_margin_s': timing_analysis['hold_margin'],
-                'timing_compatible': timing_analysis['timing_compatible'],
-                'data_throughput_mbps': clock_ref * 8 / 1e6,
-                'q_factor': optical_rx['q_factor']
-            })
+        patterns = list(self.test_conditions['data_patterns'])
+        clock_frequencies = np.asarray(self.test_conditions['clock_frequencies'], dtype=float)
+        temperatures = np.asarray(self.test_conditions['temperature_range'], dtype=float)
+        n_patterns, n_freqs, n_temps = len(patterns), len(clock_frequencies), len(temperatures)
+        n_points = n_patterns + n_freqs + n_temps
+        
+        test_type = np.array(['data_pattern'] * n_patterns + ['clock_frequency'] * n_freqs +
+                             ['temperature_variation'] * n_temps, dtype=object)
+        pattern_name = np.array(patterns + [pattern_ref] * (n_freqs + n_temps), dtype=object)
+        pattern_length = np.concatenate([np.full(n_patterns, 256), np.full(n_freqs + n_temps, 128)])
+        clock_frequency = np.concatenate([np.full(n_patterns, clock_ref, dtype=float), clock_frequencies,
+                                          np.full(n_temps, clock_ref, dtype=float)])
+        temperature = np.concatenate([np.full(n_patterns + n_freqs, temp_ref, dtype=float), temperatures])
+        supply_voltage = np.full(n_points, voltage_ref, dtype=float)
+        
+        timing_analysis = self.interface_timing_analysis(clock_frequency, temperature, supply_voltage)
+        
+        for i in range(n_points):
+            key = (pattern_name[i], int(pattern_length[i]))
+            if key not in self._patterns:
+                self._patterns[key] = self.generate_z80_data_pattern(*key)
+            self.cached_transmitter_model(pattern_name[i], self._patterns[key], clock_frequency[i])
+        
+        max_workers = min(os.cpu_count() or 1, n_points)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outputs = list(executor.map(self._run_single, pattern_name, pattern_length.tolist(),
+                                        clock_frequency, temperature))
+        
+        bit_error_rate = np.empty(n_points)
+        average_power = np.empty(n_points)
+        extinction_ratio = np.empty(n_points)
+        snr = np.empty(n_points)
+        q_factor = np.empty(n_points)
+        
+        for i, (optical_tx, optical_rx) in enumerate(outputs):
+            bit_error_rate[i] = optical_rx['theoretical_ber']
+            average_power[i] = optical_tx['average_power']
+            extinction_ratio[i] = optical_tx['extinction_ratio']
+            snr[i] = optical_rx['signal_to_noise_ratio']
+            q_factor[i] = optical_rx['q_factor']
+        
+        test_results = pd.DataFrame({
+            'test_type': test_type,
+            'pattern_name': pattern_name,
+            'clock_frequency_hz': clock_frequency,
+            'temperature_k': temperature,
+            'supply_voltage_v': supply_voltage,
+            'bit_error_rate': bit_error_rate,
+            'average_optical_power_mw': average_power,
+            'extinction_ratio_db': extinction_ratio,
+            'signal_to_noise_ratio_db': snr,
+            'timing_margin_s': timing_analysis['timing_margin'],
+            'hold_margin_s': timing_analysis['hold_margin'],
+            'timing_compatible': timing_analysis['timing_compatible'],
+            'data_throughput_mbps': clock_frequency * 8 / 1e6,
+            'q_factor': q_factor
+        })
+        
+        sample_rows = np.flatnonzero((pattern_name == pattern_ref) & (clock_frequency == 4e6) &
+                                     (temperature == 293))
+        if sample_rows.size > 0:
+            sample_index = int(sample_rows[0])
+            optical_tx, optical_rx = outputs[sample_index]
+            data = self._patterns[(pattern_ref, int(pattern_length[sample_index]))]
+        else:
+            data = self.generate_z80_data_pattern(pattern_ref, 16)
+            optical_tx = self.optical_transmitter_model(data, 4e6)
+            optical_rx = self.optical_receiver_model(optical_tx, 293)
+        self._sample_trace = (optical_tx, optical_rx, data)
         
         self.results['test_data'] = test_results
         print("Z80 optical interface characterization completed successfully.")
@@ -354,84 +387,91 @@ class Z80OpticalInterfaceTest:
             print("No test data available. Please run perform_comprehensive_test() first.")
             return
         
-        df = pd.DataFrame(self.results['test_data'])
-        
-        fig, axes = plt.subplots(2, 2, figsize=(7.0, 5.5))
-        fig.suptitle('Z80 Optical Interface Characterization\nPHCEP Experimental Validation', 
-                    fontsize=10, y=0.98)
-        
-        freq_data = df[df['test_type'] == 'clock_frequency']
-        valid_ber_data = freq_data[freq_data['bit_error_rate'] > 0]
-        if len(valid_ber_data) > 0:
-            axes[0,0].semilogy(valid_ber_data['clock_frequency_hz'] / 1e6, 
-                              valid_ber_data['bit_error_rate'], 
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+        
+        with mpl.rc_context(_PLOT_STYLE):
+            df = pd.DataFrame(self.results['test_data'])
+        
+            fig, axes = plt.subplots(2, 2, figsize=(7.0, 5.5))
+            fig.suptitle('Z80 Optical Interface Characterization\nPHCEP Experimental Validation', 
+                        fontsize=10, y=0.98)
+        
+            freq_data = df[df['test_type'] == 'clock_frequency']
+            valid_ber_data = freq_data[freq_data['bit_error_rate'] > 0]
+            if len(valid_ber_data) > 0:
+                axes[0,0].semilogy(valid_ber_data['clock_frequency_hz'] / 1e6, 
+                                  valid_ber_data['bit_error_rate'], 
+                                  'bo-', linewidth=1.2, markersize=4)
+                axes[0,0].set_ylabel('Bit Error Rate')
+            else:
+                axes[0,0].plot(freq_data['clock_frequency_hz'] / 1e6, 
+                              freq_data['bit_error_rate'], 
                               'bo-', linewidth=1.2, markersize=4)
-            axes[0,0].set_ylabel('Bit Error Rate')
-        else:
-            axes[0,0].plot(freq_data['clock_frequency_hz'] / 1e6, 
-                          freq_data['bit_error_rate'], 
-                          'bo-', linewidth=1.2, markersize=4)
-            axes[0,0].set_ylabel('Bit Error Rate')
-        axes[0,0].set_xlabel('Clock Frequency (MHz)')
-        axes[0,0].set_title('BER vs Clock Frequency', fontsize=9)
-        axes[0,0].grid(True, alpha=0.3)
-        
-        axes[0,1].plot(freq_data['clock_frequency_hz'] / 1e6, freq_data['q_factor'], 
-                      'g^-', linewidth=1.2, markersize=4)
-        axes[0,1].set_xlabel('Clock Frequency (MHz)')
-        axes[0,1].set_ylabel('Q-Factor')
-        axes[0,1].set_title('Q-Factor vs Clock Frequency', fontsize=9)
-        axes[0,1].grid(True, alpha=0.3)
-        
-        pattern_data = df[df['test_type'] == 'data_pattern']
-        x_pos = np.arange(len(pattern_data))
-        axes[1,0].bar(x_pos, pattern_data['signal_to_noise_ratio_db'], 
-                     color='green', alpha=0.7)
-        axes[1,0].set_xlabel('Data Pattern')
-        axes[1,0].set_ylabel('Signal-to-Noise Ratio (dB)')
-        axes[1,0].set_title('SNR vs Data Pattern', fontsize=9)
-        axes[1,0].set_xticks(x_pos)
-        axes[1,0].set_xticklabels(pattern_data['pattern_name'], rotation=45, fontsize=7)
-        axes[1,0].grid(True, alpha=0.3)
-        
-        axes[1,1].plot(freq_data['clock_frequency_hz'] / 1e6, freq_data['data_throughput_mbps'], 
-                      'ms-', linewidth=1.2, markersize=4)
-        axes[1,1].set_xlabel('Clock Frequency (MHz)')
-        axes[1,1].set_ylabel('Data Throughput (Mbps)')
-        axes[1,1].set_title('Throughput vs Clock Frequency', fontsize=9)
-        axes[1,1].grid(True, alpha=0.3)
-        
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
-        plt.savefig('z80_optical_interface_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        data = self.generate_z80_data_pattern('PRBS7', 16)
-        optical_tx = self.optical_transmitter_model(data, 4e6)
-        optical_rx = self.optical_receiver_model(optical_tx, 293)
-        
-        fig2, (ax1, ax2) = plt.subplots(2, 1, figsize=(7.0, 4.0))
-        
-        ax1.plot(optical_tx['time_vector'] * 1e6, optical_tx['optical_waveform'] * 1e3, 
-                'b-', linewidth=1.2, label='Optical Power')
-        ax1.set_xlabel('Time (μs)')
-        ax1.set_ylabel('Optical Power (mW)')
-        ax1.set_title('Transmitted Optical Waveform (PRBS7)', fontsize=9)
-        ax1.legend(fontsize=8)
-        ax1.grid(True, alpha=0.3)
-        
-        ax2.plot(optical_tx['time_vector'] * 1e6, optical_rx['photocurrent'] * 1e3, 
-                'r-', linewidth=1.2, label='Photocurrent')
-        ax2.axhline(y=optical_rx['decision_threshold'] * 1e3, color='k', linestyle='--', 
-                   label='Decision Threshold')
-        ax2.set_xlabel('Time (μs)')
-        ax2.set_ylabel('Photocurrent (mA)')
-        ax2.set_title('Received Electrical Signal', fontsize=9)
-        ax2.legend(fontsize=8)
-        ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig('z80_optical_waveforms.png', dpi=300, bbox_inches='tight')
-        plt.show()
+                axes[0,0].set_ylabel('Bit Error Rate')
+            axes[0,0].set_xlabel('Clock Frequency (MHz)')
+            axes[0,0].set_title('BER vs Clock Frequency', fontsize=9)
+            axes[0,0].grid(True, alpha=0.3)
+        
+            axes[0,1].plot(freq_data['clock_frequency_hz'] / 1e6, freq_data['q_factor'], 
+                          'g^-', linewidth=1.2, markersize=4)
+            axes[0,1].set_xlabel('Clock Frequency (MHz)')
+            axes[0,1].set_ylabel('Q-Factor')
+            axes[0,1].set_title('Q-Factor vs Clock Frequency', fontsize=9)
+            axes[0,1].grid(True, alpha=0.3)
+        
+            pattern_data = df[df['test_type'] == 'data_pattern']
+            x_pos = np.arange(len(pattern_data))
+            axes[1,0].bar(x_pos, pattern_data['signal_to_noise_ratio_db'], 
+                         color='green', alpha=0.7)
+            axes[1,0].set_xlabel('Data Pattern')
+            axes[1,0].set_ylabel('Signal-to-Noise Ratio (dB)')
+            axes[1,0].set_title('SNR vs Data Pattern', fontsize=9)
+            axes[1,0].set_xticks(x_pos)
+            axes[1,0].set_xticklabels(pattern_data['pattern_name'], rotation=45, fontsize=7)
+            axes[1,0].grid(True, alpha=0.3)
+        
+            axes[1,1].plot(freq_data['clock_frequency_hz'] / 1e6, freq_data['data_throughput_mbps'], 
+                          'ms-', linewidth=1.2, markersize=4)
+            axes[1,1].set_xlabel('Clock Frequency (MHz)')
+            axes[1,1].set_ylabel('Data Throughput (Mbps)')
+            axes[1,1].set_title('Throughput vs Clock Frequency', fontsize=9)
+            axes[1,1].grid(True, alpha=0.3)
+        
+            plt.tight_layout(rect=[0, 0, 1, 0.96])
+            plt.savefig('z80_optical_interface_analysis.png', dpi=300, bbox_inches='tight')
+            plt.show()
+        
+            if self._sample_trace is None:
+                return
+            
+            optical_tx, optical_rx, _ = self._sample_trace
+            n_samples = 16 * 8 * optical_tx['samples_per_bit']
+            time_vector = self.transmitter_time_vector(optical_tx)[:n_samples]
+        
+            fig2, (ax1, ax2) = plt.subplots(2, 1, figsize=(7.0, 4.0))
+        
+            ax1.plot(time_vector * 1e6, optical_tx['optical_waveform'][:n_samples] * 1e3, 
+                    'b-', linewidth=1.2, label='Optical Power')
+            ax1.set_xlabel('Time (μs)')
+            ax1.set_ylabel('Optical Power (mW)')
+            ax1.set_title('Transmitted Optical Waveform (PRBS7)', fontsize=9)
+            ax1.legend(fontsize=8)
+            ax1.grid(True, alpha=0.3)
+        
+            ax2.plot(time_vector * 1e6, optical_rx['photocurrent'][:n_samples] * 1e3, 
+                    'r-', linewidth=1.2, label='Photocurrent')
+            ax2.axhline(y=optical_rx['decision_threshold'] * 1e3, color='k', linestyle='--', 
+                       label='Decision Threshold')
+            ax2.set_xlabel('Time (μs)')
+            ax2.set_ylabel('Photocurrent (mA)')
+            ax2.set_title('Received Electrical Signal', fontsize=9)
+            ax2.legend(fontsize=8)
+            ax2.grid(True, alpha=0.3)
+        
+            plt.tight_layout()
+            plt.savefig('z80_optical_waveforms.png', dpi=300, bbox_inches='tight')
+            plt.show()
     
     def generate_summary_report(self):
         if not self.results:
@@ -445,29 +485,28 @@ class Z80OpticalInterfaceTest:
         print("PHCEP Experimental Validation Platform")
         print("="*70)
         
-        pattern_data = df[df['test_type'] == 'data_pattern']
-        freq_data = df[df['test_type'] == 'clock_frequency']
-        temp_data = df[df['test_type'] == 'temperature_variation']
+        ber = df['bit_error_rate'].to_numpy(dtype=float)
+        snr = df['signal_to_noise_ratio_db'].to_numpy(dtype=float)
         
-        valid_ber = df[df['bit_error_rate'] > 0]['bit_error_rate']
-        if len(valid_ber) > 0:
+        valid_ber = ber[ber > 0]
+        if valid_ber.size > 0:
             min_ber = valid_ber.min()
             max_ber = valid_ber.max()
             avg_ber = valid_ber.mean()
         else:
             min_ber = max_ber = avg_ber = 1e-12
             
-        finite_snr = df[np.isfinite(df['signal_to_noise_ratio_db'])]['signal_to_noise_ratio_db']
-        if len(finite_snr) > 0:
+        finite_snr = snr[np.isfinite(snr)]
+        if finite_snr.size > 0:
             avg_snr = finite_snr.mean()
         else:
             avg_snr = 30.0
             
-        min_timing_margin = df['timing_margin_s'].min()
-        max_throughput = df['data_throughput_mbps'].max()
-        avg_q_factor = df['q_factor'].mean()
+        min_timing_margin = df['timing_margin_s'].to_numpy(dtype=float).min()
+        max_throughput = df['data_throughput_mbps'].to_numpy(dtype=float).max()
+        avg_q_factor = df['q_factor'].to_numpy(dtype=float).mean()
         
-        compatible_tests = df['timing_compatible'].sum()
+        compatible_tests = int(np.count_nonzero(df['timing_compatible'].to_numpy()))
         total_tests = len(df)
         
         print(f"\nKEY PERFORMANCE METRICS:")
@@ -19,8 +19,8 @@ class RibWaveguideMath:
 
     def rib_v_parameter(self, width, etch_depth_ratio):
         n_eff = self.calculate_effective_index(etch_depth_ratio)
-        delta = max(n_eff**2 - self.n_clad**2, 0.0)
-        V = (2.0 * math.pi / self.wavelength) * width * math.sqrt(delta)
+        delta = np.maximum(n_eff**2 - self.n_clad**2, 0.0)
+        V = (2.0 * math.pi / self.wavelength) * width * np.sqrt(delta)
         return V, n_eff
 
     def optimize_for_width(self, target_width, etch_ratios=None):
@@ -30,28 +30,30 @@ class RibWaveguideMath:
         print("=== MATHEMATICAL RIB WAVEGUIDE OPTIMIZATION ===")
         print(f"Scanning width = {target_width} µm")
 
-        valid_designs = []
+        etch_ratios = np.asarray(etch_ratios, dtype=float)
+        V_eff, n_eff = self.rib_v_parameter(target_width, etch_ratios)
+        mask = (V_eff > 0) & (V_eff < math.pi)
 
-        for ratio in etch_ratios:
-            V_eff, n_eff = self.rib_v_parameter(target_width, ratio)
+        if np.any(mask):
+            ratios = etch_ratios[mask]
+            depths = ratios * self.total_height
+            V_valid = V_eff[mask]
+            n_valid = n_eff[mask]
 
-            if V_eff < math.pi and V_eff > 0:
-                valid_designs.append({
-                    'width': target_width,
-                    'etch_ratio': ratio,
-                    'etch_depth': ratio * self.total_height,
-                    'V_effective': V_eff,
-                    'n_effective': n_eff
-                })
-
-        if valid_designs:
             print(f"Valid single-mode rib designs for width={target_width}µm:")
-            for design in valid_designs:
-                print(f"  Etch ratio: {design['etch_ratio']:.1%} "
-                      f"(depth: {design['etch_depth']:.3f}µm) → "
-                      f"V_eff={design['V_effective']:.3f}, n_eff={design['n_effective']:.3f}")
-
-            optimal = min(valid_designs, key=lambda x: abs(x['etch_ratio'] - 0.5))
+            for ratio, depth, V, n in zip(ratios, depths, V_valid, n_valid):
+                print(f"  Etch ratio: {ratio:.1%} "
+                      f"(depth: {depth:.3f}µm) → "
+                      f"V_eff={V:.3f}, n_eff={n:.3f}")
+
+            best = np.argmin(np.abs(ratios - 0.5))
+            optimal = {
+                'width': target_width,
+                'etch_ratio': ratios[best],
+                'etch_depth': depths[best],
+                'V_effective': V_valid[best],
+                'n_effective': n_valid[best]
+            }
             print(f"\n OPTIMAL RIB DESIGN:")
             print(f"  Width: {optimal['width']}µm")
             print(f"  Etch ratio: {optimal['etch_ratio']:.1%}")
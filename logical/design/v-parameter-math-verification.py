@@ -10,10 +10,20 @@ class SingleModeMathTest:
         self.pi = math.pi
         
     def calculate_v_parameters(self, width, height):
+        k0 = 2 * np.pi / self.wavelength
+        delta = np.sqrt(self.n_core**2 - self.n_clad**2)
+        Vx = k0 * np.asarray(width, dtype=float) * delta
+        Vy = k0 * np.asarray(height, dtype=float) * delta
+        return Vx, Vy
+    
+    def is_single_mode(self, width, height):
         Vx, Vy = self.calculate_v_parameters(width, height)
-        return Vx < self.pi and Vy < self.pi, Vx, Vy
+        return (Vx < self.pi) & (Vy < self.pi), Vx, Vy
     
     def calculate_safe_margin(self, Vx, Vy):
+        return np.minimum(self.pi - Vx, self.pi - Vy)
+    
+    def verify_test_cases(self):
         test_cases = [
             (0.40, 0.36, "Original problematic"),
             (0.22, 0.18, "Recommended single-mode"),
@@ -27,21 +37,28 @@ class SingleModeMathTest:
         print(f"Single-mode condition: Vx < π AND Vy < π (π ≈ {self.pi:.3f})")
         print()
         
+        widths = np.array([case[0] for case in test_cases])
+        heights = np.array([case[1] for case in test_cases])
+        valid, Vx, Vy = self.is_single_mode(widths, heights)
+        margins = self.calculate_safe_margin(Vx, Vy)
+        
         results = []
-        for width, height, desc in test_cases:
-            valid, Vx, Vy = self.is_single_mode(width, height)
-            margin = self.calculate_safe_margin(Vx, Vy)
-            
-            status = "PASS" if valid else "FAIL"
+        for i, (width, height, desc) in enumerate(test_cases):
+            status = "PASS" if valid[i] else "FAIL"
             results.append({
                 'width': width, 'height': height, 'description': desc,
-                'Vx': Vx, 'Vy': Vy, 'valid': valid, 'margin': margin
+                'Vx': Vx[i], 'Vy': Vy[i], 'valid': bool(valid[i]), 'margin': margins[i]
             })
             
-            print(f"{desc:>25}: {width}×{height}µm → Vx={Vx:.3f}, Vy={Vy:.3f} → {status}")
-            if valid:
-                print(f"{'':>25}  Safety margin: {margin:.3f}")
+            print(f"{desc:>25}: {width}×{height}µm → Vx={Vx[i]:.3f}, Vy={Vy[i]:.3f} → {status}")
+            if valid[i]:
+                print(f"{'':>25}  Safety margin: {margins[i]:.3f}")
         
         return results
 
 def mathematical_proof():
+    tester = SingleModeMathTest()
+    return tester.verify_test_cases()
+
+if __name__ == "__main__":
+    mathematical_proof()
@@ -1,13 +1,23 @@
 
+import functools
+from operator import itemgetter
 import numpy as np
 import matplotlib.pyplot as plt
 
+_CACHE_DECIMALS = 6
+
+@functools.lru_cache(maxsize=4096)
+def _confinement_factor_rectangular(width, height, n_core, n_clad, wavelength=1.55):
+    base_confinement = _confinement_factor_rectangular(width, height, n_core, n_clad)
+    return min(0.98, base_confinement * rib_enhancement)
+
 class WaveguideOptimizer:
     def __init__(self):
         
     def confinement_factor_rectangular(self, width, height, n_core=3.5, n_clad=1.44, wavelength=1.55):
-        base_confinement = self.confinement_factor_rectangular(width, height, n_core, n_clad)
-        return min(0.98, base_confinement * rib_enhancement)
+        return _confinement_factor_rectangular(round(width, _CACHE_DECIMALS), round(height, _CACHE_DECIMALS),
+                                               round(n_core, _CACHE_DECIMALS), round(n_clad, _CACHE_DECIMALS),
+                                               round(wavelength, _CACHE_DECIMALS))
     
     def bending_loss_vs_confinement(self, confinement, radius):
         best_designs = []
@@ -33,7 +43,7 @@ class WaveguideOptimizer:
                         'aspect_ratio': aspect_ratio
                     })
         
-        best_designs.sort(key=lambda x: x['confinement'], reverse=True)
+        best_designs.sort(key=itemgetter('confinement'), reverse=True)
 
 def main():
     print("=== Waveguide Geometry Optimization ===")
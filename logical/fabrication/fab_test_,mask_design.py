@@ -1,8 +1,32 @@
 
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle, Circle, Polygon
 import math
+import itertools
+
+STRUCTURE_DTYPE = np.dtype([
+    ('type', 'U20'), ('x', 'f8'), ('y', 'f8'), ('width', 'f8'), ('length', 'f8'),
+    ('width_start', 'f8'), ('width_end', 'f8'), ('radius', 'f8'), ('gap', 'f8'),
+    ('coupling_length', 'f8'), ('size', 'f8'), ('height', 'f8'), ('label', 'U40')
+])
+STRING_FIELD_LENGTHS = {'type': 20, 'label': 40}
+
+def structure_to_row(structure):
+    unknown = set(structure) - set(STRUCTURE_DTYPE.names)
+    if unknown:
+        raise ValueError(f"Unknown structure fields {sorted(unknown)} in {structure.get('label', structure)}")
+    for name, max_length in STRING_FIELD_LENGTHS.items():
+        if len(structure.get(name, '')) > max_length:
+            raise ValueError(f"Structure {name} longer than {max_length} characters: {structure[name]!r}")
+    return tuple(structure.get(name, '' if name in STRING_FIELD_LENGTHS else np.nan)
+                 for name in STRUCTURE_DTYPE.names)
+
+def structures_to_array(structures):
+    if isinstance(structures, np.ndarray):
+        return structures
+    return np.array([structure_to_row(s) for s in structures], dtype=STRUCTURE_DTYPE)
 
 class FabTestMaskDesign:
     def __init__(self, chip_size=5000, waveguide_width=0.22, waveguide_height=0.18):
@@ -10,35 +34,34 @@ class FabTestMaskDesign:
         self.wg_height = waveguide_height
     
     def straight_waveguide_array(self, lengths=[1000, 5000, 10000]):
-        structures = []
         y_position = 1500
         wide_width = 0.40
         narrow_width = 0.22
         
         for i, taper_len in enumerate(taper_lengths):
-            structures.append({
+            yield {
                 'type': 'waveguide',
                 'x': 100, 'y': y_position,
                 'width': wide_width, 'length': 50,
                 'label': f'Wide_in_{taper_len}um'
-            })
+            }
             
-            structures.append({
+            yield {
                 'type': 'taper',
                 'x': 150, 'y': y_position,
                 'width_start': wide_width, 'width_end': narrow_width,
                 'length': taper_len,
                 'label': f'Taper_{taper_len}um'
-            })
+            }
             
-            structures.append({
+            yield {
                 'type': 'waveguide', 
                 'x': 150 + taper_len, 'y': y_position,
                 'width': narrow_width, 'length': 50,
                 'label': f'Narrow_out_{taper_len}um'
-            })
+            }
             
-            structures.extend([
+            yield from [
                 {
                     'type': 'grating_coupler',
                     'x': 50, 'y': y_position,
@@ -51,24 +74,21 @@ class FabTestMaskDesign:
                     'width': 20, 'length': 50,
                     'label': f'GC_taper_out_{taper_len}um'
                 }
-            ])
+            ]
             
             y_position += self.layer_spacing
         
-        return structures
-    
     def rib_waveguide_variants(self, etch_depths=[0.70, 0.75, 0.80]):
-        structures = []
         y_position = 4500
         
-        structures.append({
+        yield {
             'type': 'waveguide',
             'x': 100, 'y': y_position,
             'width': self.wg_width, 'length': 100,
             'label': 'Ring_bus_waveguide'
-        })
+        }
         
-        structures.append({
+        yield {
             'type': 'ring_resonator',
             'x': 150, 'y': y_position,
             'radius': radius,
@@ -76,9 +96,9 @@ class FabTestMaskDesign:
             'gap': gap,
             'coupling_length': coupling_length,
             'label': f'Ring_R{radius}um_gap{gap}um'
-        })
+        }
         
-        structures.extend([
+        yield from [
             {
                 'type': 'grating_coupler',
                 'x': 50, 'y': y_position,
@@ -97,31 +117,29 @@ class FabTestMaskDesign:
                 'width': 20, 'length': 50,
                 'label': 'GC_ring_drop'
             }
-        ])
+        ]
         
-        return structures
-    
     def process_control_monitors(self):
         print("=== FAB TEST MASK DESIGN ===")
         print("Waveguide geometry: 0.22×0.18 µm (single-mode)")
         print(f"Chip size: {self.chip_size}×{self.chip_size} µm")
         print()
         
-        all_structures = []
-        
-        all_structures.extend(self.straight_waveguide_array())
-        all_structures.extend(self.taper_designs())
-        all_structures.extend(self.rib_waveguide_variants())
-        all_structures.extend(self.ring_resonator_design())
-        all_structures.extend(self.process_control_monitors())
+        all_structures = itertools.chain(
+            self.straight_waveguide_array(),
+            self.taper_designs(),
+            self.rib_waveguide_variants(),
+            self.ring_resonator_design(),
+            self.process_control_monitors()
+        )
         
-        return all_structures
+        return np.fromiter((structure_to_row(s) for s in all_structures), dtype=STRUCTURE_DTYPE)
     
     def calculate_expected_performance(self):
         FSR_corrected = (1.55**2) / (n_g * circumference * 1e-3)
-        print(f"Ring R={radius}µm, n_eff={n_eff}:")
-        print(f"  FSR (n_eff): {FSR:.1f} nm")
-        print(f"  FSR (n_g): {FSR_corrected:.1f} nm")
+        columns = np.broadcast_arrays(*np.atleast_1d(radius, n_eff, FSR, FSR_corrected))
+        print(pd.DataFrame(dict(zip(['R_um', 'n_eff', 'FSR_n_eff_nm', 'FSR_n_g_nm'], columns)))
+              .to_string(index=False, formatters={'FSR_n_eff_nm': '{:.1f}'.format, 'FSR_n_g_nm': '{:.1f}'.format}))
         return FSR_corrected
 
 def visualize_mask_design(structures):
@@ -146,11 +164,11 @@ LAYER_MAPPING = {
 def generate_gds_script(structures):
     print("Integrating PCMs into mask design...")
     
-    existing_pcm_types = ['pcm_etch', 'pcm_width']
-    filtered_structures = [s for s in mask_structures 
-                          if s.get('type') not in existing_pcm_types]
+    existing_pcm_types = np.array(['pcm_etch', 'pcm_width'])
+    mask_array = structures_to_array(mask_structures)
+    filtered_structures = mask_array[~np.isin(mask_array['type'], existing_pcm_types)]
     
-    integrated_structures = filtered_structures + pcm_structures
+    integrated_structures = np.concatenate([filtered_structures, structures_to_array(pcm_structures)])
     
     print(f"Added {len(pcm_structures)} PCM structures")
     print(f"Total structures in mask: {len(integrated_structures)}")
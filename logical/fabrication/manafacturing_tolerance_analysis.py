@@ -12,36 +12,37 @@ class CorrectedToleranceAnalyzer:
         self.wavelength = 1.55
         
     def calculate_v_parameters(self, width, height, n_core):
+        k0 = 2 * np.pi / self.wavelength
+        numerical_aperture = np.sqrt(n_core**2 - self.n_clad**2)
+        Vx = k0 * (np.asarray(width) / 2) * numerical_aperture
+        Vy = k0 * (np.asarray(height) / 2) * numerical_aperture
+        return Vx, Vy
+    
+    def is_single_mode(self, width, height, n_core):
         Vx, Vy = self.calculate_v_parameters(width, height, n_core)
-        return Vx < np.pi and Vy < np.pi
+        return (Vx < np.pi) & (Vy < np.pi)
     
-        results = []
+    def analyze_etch_variations(self, width_variation, height_variation):
+        dw, dh = np.meshgrid(width_variation, height_variation, indexing='ij')
+        new_width = self.nominal_width + dw
+        new_height = self.nominal_height + dh
+        
+        Vx, Vy = self.calculate_v_parameters(new_width, new_height, self.nominal_index)
+        single_mode = (Vx < np.pi) & (Vy < np.pi)
         
-        for dw in width_variation:
-            for dh in height_variation:
-                new_width = self.nominal_width + dw
-                new_height = self.nominal_height + dh
-                
-                single_mode = self.is_single_mode(new_width, new_height, self.nominal_index)
-                
-                area_original = self.nominal_width * self.nominal_height
-                area_new = new_width * new_height
-                confinement_change = (area_new - area_original) / area_original
-                
-                Vx, Vy = self.calculate_v_parameters(new_width, new_height, self.nominal_index)
-                
-                results.append({
-                    'width_variation_um': dw,
-                    'height_variation_um': dh,
-                    'new_width': new_width,
-                    'new_height': new_height,
-                    'confinement_change': confinement_change,
-                    'remains_single_mode': single_mode,
-                    'V_parameter_x': Vx,
-                    'V_parameter_y': Vy
-                })
+        area_original = self.nominal_width * self.nominal_height
+        confinement_change = (new_width * new_height - area_original) / area_original
         
-        return pd.DataFrame(results)
+        return pd.DataFrame({
+            'width_variation_um': dw.ravel(),
+            'height_variation_um': dh.ravel(),
+            'new_width': new_width.ravel(),
+            'new_height': new_height.ravel(),
+            'confinement_change': confinement_change.ravel(),
+            'remains_single_mode': single_mode.ravel(),
+            'V_parameter_x': Vx.ravel(),
+            'V_parameter_y': Vy.ravel()
+        })
     
     def analyze_single_mode_geometries(self):
     plt.figure(figsize=(15, 10))
@@ -80,21 +81,21 @@ class CorrectedToleranceAnalyzer:
     heights = np.linspace(0.15, 0.4, 50)
     W, H = np.meshgrid(widths, heights)
     
-    single_mode_region = np.zeros_like(W)
     analyzer = CorrectedToleranceAnalyzer()
-    
-    for i in range(len(widths)):
-        for j in range(len(heights)):
-            single_mode_region[j, i] = analyzer.is_single_mode(widths[i], heights[j], 3.5)
+    single_mode_region = analyzer.is_single_mode(W, H, 3.5).astype(float)
     
     plt.contourf(W, H, single_mode_region, levels=[-0.5, 0.5, 1.5], colors=['red', 'green'], alpha=0.3)
     plt.contour(W, H, single_mode_region, levels=[0.5], colors='black', linewidths=2)
     
-    for _, geo in sm_geometries.iterrows():
-        color = 'green' if geo['single_mode'] else 'red'
-        marker = 'o' if geo['single_mode'] else 'x'
-        plt.scatter(geo['width'], geo['height'], color=color, marker=marker, s=100, 
-                   label=geo['name'] if geo['name'] == 'Conservative SM' else "")
+    sm_mask = sm_geometries['single_mode'].to_numpy(dtype=bool)
+    labelled = (sm_geometries['name'] == 'Conservative SM').to_numpy()
+    plt.scatter(sm_geometries['width'][sm_mask & ~labelled], sm_geometries['height'][sm_mask & ~labelled],
+               color='green', marker='o', s=100)
+    plt.scatter(sm_geometries['width'][~sm_mask & ~labelled], sm_geometries['height'][~sm_mask & ~labelled],
+               color='red', marker='x', s=100)
+    for geo in sm_geometries[labelled].itertuples(index=False):
+        plt.scatter(geo.width, geo.height, color='green' if geo.single_mode else 'red',
+                   marker='o' if geo.single_mode else 'x', s=100, label=geo.name)
     
     plt.xlabel('Waveguide Width (µm)')
     plt.ylabel('Waveguide Height (µm)')
@@ -6,13 +6,22 @@ import pandas as pd
 from datetime import datetime
 import subprocess
 import sys
+import concurrent.futures
+
+PERFORMANCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'performance')
+if PERFORMANCE_DIR not in sys.path:
+    sys.path.insert(0, PERFORMANCE_DIR)
+
+def _analyze_cutback(file_path):
+    from cutback_loss_analysis import CutbackAnalyzer
+    return CutbackAnalyzer().analyze_cutback(file_path, None, False)
 
 class ExperimentRunner:
     def __init__(self, data_directory="data/fab_test"):
         self.data_dir = data_directory
         self.results_summary = {}
         self.analysis_scripts = {
-            'cutback': 'cutback_analysis.py',
+            'cutback': 'cutback_loss_analysis.py',
             'taper': 'taper_loss_analysis.py', 
             'ring': 'ring_q_analysis.py',
             'pcm': 'pcm_correlation.py'
@@ -21,32 +30,27 @@ class ExperimentRunner:
     def discover_data_files(self):
         print("Running cut-back analysis...")
         
-        for file_path in cutback_files:
-            try:
-                result = subprocess.run([
-                    sys.executable, 'cutback_analysis.py', file_path, '--no-plot'
-                ], capture_output=True, text=True)
-                
-                if result.returncode == 0:
+        workers = min(len(cutback_files), os.cpu_count() or 1) or 1
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_analyze_cutback, file_path): file_path for file_path in cutback_files}
+            for future in concurrent.futures.as_completed(futures):
+                file_path = futures[future]
+                try:
+                    self.results_summary[os.path.basename(file_path)] = future.result()
                     print(f"✓ {os.path.basename(file_path)}")
-                    result_file = file_path.replace('.csv', '_results.json')
-                    if os.path.exists(result_file):
-                        with open(result_file, 'r') as f:
-                            self.results_summary[os.path.basename(file_path)] = json.load(f)
-                else:
-                    print(f"✗ {os.path.basename(file_path)}: {result.stderr}")
-                    
-            except Exception as e:
-                print(f"Error analyzing {file_path}: {e}")
+                except Exception as e:
+                    print(f"✗ {os.path.basename(file_path)}: {e}")
     
     def run_taper_analysis(self, taper_files):
         pairs = []
+        references_by_dir = {}
         
         for taper_file in taper_files:
-            ref_candidates = []
-            for file in glob.glob(os.path.join(os.path.dirname(taper_file), "*reference*")):
-                if 'taper' not in file.lower():
-                    ref_candidates.append(file)
+            directory = os.path.dirname(taper_file)
+            if directory not in references_by_dir:
+                references_by_dir[directory] = [file for file in glob.glob(os.path.join(directory, "*reference*"))
+                                                if 'taper' not in file.lower()]
+            ref_candidates = references_by_dir[directory]
             
             if ref_candidates:
                 pairs.append((taper_file, ref_candidates[0]))
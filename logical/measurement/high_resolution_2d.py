@@ -1,64 +1,62 @@
 
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 class HighResBendSweep:
-    def __init__(self):
+    def __init__(self, num_segments=1000):
         self.results = []
+        self.num_segments = num_segments
+        self._s = np.linspace(0, 1, num_segments)
+        self._ds = 1.0 / num_segments
     
     def circular_bend_loss(self, radius, confinement):
-        if radius <= 0:
-            return 100.0
+        radius = np.asarray(radius, dtype=float)
+        invalid = radius <= 0
+        if np.any(invalid):
+            valid_loss = self.circular_bend_loss(np.where(invalid, 1.0, radius), confinement)
+            return np.where(invalid, 100.0, valid_loss)
             
-        s_values = np.linspace(0, 1, num_segments)
+        s_values = self._s
         
-        total_loss = 0.0
-        ds = 1.0 / num_segments
+        ds = self._ds
         
-        for i, s in enumerate(s_values):
-            if i == 0:
-                continue
-                
-            local_radius = 1.0 / curvatures[i] if curvatures[i] > 0 else 1e6
-            segment_loss = self.circular_bend_loss(local_radius, confinement) * ds
-            total_loss += segment_loss
+        segment_curvatures = np.asarray(curvatures, dtype=float)[..., 1:]
+        local_radii = np.divide(1.0, segment_curvatures, out=np.full_like(segment_curvatures, 1e6),
+                                where=segment_curvatures > 0)
+        segment_losses = self.circular_bend_loss(local_radii, np.asarray(confinement)[..., np.newaxis])
+        total_loss = np.sum(segment_losses, axis=-1) * ds
         
         length_ratio = euler_length / circular_length
         
         return total_loss * length_ratio
     
     def calculate_flux(self, loss_dB):
+        return 10 ** (-np.asarray(loss_dB, dtype=float) / 10)
+    
+    def run_sweep(self):
         print("Running high-resolution 2D sweep...")
-        total_points = len(self.radii) * len(self.confinements)
+        R, C = np.meshgrid(self.radii, self.confinements, indexing='ij')
+        
+        loss_circ = np.broadcast_to(self.circular_bend_loss(R, C), R.shape)
+        loss_euler = np.broadcast_to(self.euler_bend_loss(R, C), R.shape)
+        
+        flux_circ = self.calculate_flux(loss_circ)
+        flux_euler = self.calculate_flux(loss_euler)
+        
+        safe_loss_circ = np.where(loss_circ > 0, loss_circ, 1.0)
+        improvement = np.where(loss_circ > 0, (loss_circ - loss_euler) / safe_loss_circ * 100, 0.0)
         
-        with tqdm(total=total_points) as pbar:
-            for radius in self.radii:
-                for confinement in self.confinements:
-                    loss_circ = self.circular_bend_loss(radius, confinement)
-                    loss_euler = self.euler_bend_loss(radius, confinement)
-                    
-                    flux_circ = self.calculate_flux(loss_circ)
-                    flux_euler = self.calculate_flux(loss_euler)
-                    
-                    if loss_circ > 0:
-                        improvement = ((loss_circ - loss_euler) / loss_circ) * 100
-                    else:
-                        improvement = 0
-                    
-                    self.results.append({
-                        'radius_um': radius,
-                        'confinement': confinement,
-                        'flux_circular': flux_circ,
-                        'flux_euler': flux_euler,
-                        'loss_circular_dB': loss_circ,
-                        'loss_euler_dB': loss_euler,
-                        'improvement_percent': improvement
-                    })
-                    
-                    pbar.update(1)
+        self.results = pd.DataFrame({
+            'radius_um': R.ravel(),
+            'confinement': C.ravel(),
+            'flux_circular': flux_circ.ravel(),
+            'flux_euler': flux_euler.ravel(),
+            'loss_circular_dB': loss_circ.ravel(),
+            'loss_euler_dB': loss_euler.ravel(),
+            'improvement_percent': improvement.ravel()
+        })
         
-        return pd.DataFrame(self.results)
+        return self.results
     
     def analyze_critical_cases(self, df):
     print("=== High-Resolution 2D Parameter Sweep ===")
@@ -1,5 +1,9 @@
 
+import os
 import numpy as np
+import matplotlib
+if not os.environ.get('PHCEP_SHOW'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
 class TelluriumAnalyzer:
@@ -46,7 +50,9 @@ class TelluriumAnalyzer:
         
         plt.tight_layout()
         plt.savefig('te_doping_optimization.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        if os.environ.get('PHCEP_SHOW'):
+            plt.show()
+        plt.close()
         
         return opt_conc, opt_idx, opt_loss
 
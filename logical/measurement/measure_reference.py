@@ -1,6 +1,10 @@
 
+import os
 import numpy as np
 import pandas as pd
+import matplotlib
+if not os.environ.get('PHCEP_SHOW'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import time
 from datetime import datetime
@@ -10,6 +14,8 @@ class ReferenceMeasurement:
     def __init__(self, instrument_simulated=True):
         self.instrument_simulated = instrument_simulated
         self.measurement_data = []
+        self._fig = None
+        self._ax = None
         
     def simulate_instrument_measurement(self, wavelength_nm, waveguide_type="straight_0.22um"):
         print(f"Measuring reference waveguide: {waveguide_id}")
@@ -17,20 +23,17 @@ class ReferenceMeasurement:
         print(f"Number of points: {num_points}")
         
         wavelengths = np.linspace(start_wavelength, stop_wavelength, num_points)
-        powers = []
         
-        for i, wl in enumerate(wavelengths):
-            if self.instrument_simulated:
-                power = self.simulate_instrument_measurement(wl, waveguide_id)
-            else:
-                power = self.simulate_instrument_measurement(wl, waveguide_id)
+        if self.instrument_simulated:
+            powers = np.asarray(self.simulate_instrument_measurement(wavelengths, waveguide_id), dtype=float)
+        else:
+            powers = np.empty(num_points)
+            for i, wl in enumerate(wavelengths):
+                powers[i] = self.simulate_instrument_measurement(wl, waveguide_id)
                 
-            powers.append(power)
-            
-            if i % 20 == 0:
-                print(f"  Progress: {i}/{num_points} points")
-                
-            if not self.instrument_simulated:
+                if i % 20 == 0:
+                    print(f"  Progress: {i}/{num_points} points")
+                    
                 time.sleep(0.1)
         
         df = pd.DataFrame({
@@ -48,22 +51,28 @@ class ReferenceMeasurement:
             print("No measurement data to plot!")
             return
             
-        plt.figure(figsize=(10, 6))
-        plt.plot(self.measurement_data['wavelength_nm'], self.measurement_data['power_dBm'], 
+        if self._fig is None:
+            self._fig, self._ax = plt.subplots(figsize=(10, 6))
+        else:
+            self._ax.cla()
+        ax = self._ax
+        
+        ax.plot(self.measurement_data['wavelength_nm'], self.measurement_data['power_dBm'], 
                 'b-', linewidth=2, label='Reference waveguide')
-        plt.xlabel('Wavelength (nm)')
-        plt.ylabel('Transmitted Power (dBm)')
-        plt.title('Reference Waveguide Measurement\n(Straight 0.22×0.18 µm waveguide)')
-        plt.grid(True, alpha=0.3)
-        plt.legend()
+        ax.set_xlabel('Wavelength (nm)')
+        ax.set_ylabel('Transmitted Power (dBm)')
+        ax.set_title('Reference Waveguide Measurement\n(Straight 0.22×0.18 µm waveguide)')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
         
-        plt.text(0.02, 0.98, f"Waveguide: {self.measurement_data['waveguide_type'].iloc[0]}\n"
+        ax.text(0.02, 0.98, f"Waveguide: {self.measurement_data['waveguide_type'].iloc[0]}\n"
                 f"Points: {len(self.measurement_data)}", 
-                transform=plt.gca().transAxes, fontsize=10,
+                transform=ax.transAxes, fontsize=10,
                 verticalalignment='top', bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8))
         
-        plt.tight_layout()
-        plt.savefig('reference_measurement.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        self._fig.tight_layout()
+        self._fig.savefig('reference_measurement.png', dpi=300, bbox_inches='tight')
+        if os.environ.get('PHCEP_SHOW'):
+            plt.show()
 
 def main():
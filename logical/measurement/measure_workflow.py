@@ -2,6 +2,7 @@
 import os
 import subprocess
 import sys
+import concurrent.futures
 from datetime import datetime
 
 class MeasurementWorkflow:
@@ -18,26 +19,31 @@ class MeasurementWorkflow:
             return False
         
         success_count = 0
-        for taper_length in taper_lengths:
-            print(f"Measuring {taper_length}µm taper...")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(8, len(taper_lengths)))) as executor:
+            futures = {}
+            for taper_length in taper_lengths:
+                print(f"Measuring {taper_length}µm taper...")
+                futures[executor.submit(subprocess.run, [
+                    sys.executable, "measure_taper.py",
+                    "--taper-length", str(taper_length),
+                    "--reference-csv", reference_csv
+                ], capture_output=True, text=True)] = taper_length
             
-            result = subprocess.run([
-                sys.executable, "measure_taper.py",
-                "--taper-length", str(taper_length),
-                "--reference-csv", reference_csv
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print(f"✓ {taper_length}µm taper measurement completed")
-                success_count += 1
+            for future in concurrent.futures.as_completed(futures):
+                taper_length = futures[future]
+                result = future.result()
                 
-                for file in [f"taper_{taper_length}um.csv", 
-                           f"taper_{taper_length}um_metadata.json",
-                           f"taper_{taper_length}um_analysis.png"]:
-                    if os.path.exists(file):
-                        os.rename(file, os.path.join(self.output_dir, file))
-            else:
-                print(f"✗ {taper_length}µm taper measurement failed: {result.stderr}")
+                if result.returncode == 0:
+                    print(f"✓ {taper_length}µm taper measurement completed")
+                    success_count += 1
+                    
+                    for file in [f"taper_{taper_length}um.csv", 
+                               f"taper_{taper_length}um_metadata.json",
+                               f"taper_{taper_length}um_analysis.png"]:
+                        if os.path.exists(file):
+                            os.rename(file, os.path.join(self.output_dir, file))
+                else:
+                    print(f"✗ {taper_length}µm taper measurement failed: {result.stderr}")
         
         return success_count > 0
     
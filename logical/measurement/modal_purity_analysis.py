@@ -1,8 +1,12 @@
 
+import os
 import numpy as np
+import matplotlib
+if not os.environ.get('PHCEP_SHOW'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-from scipy.linalg import eigh
 from scipy.sparse import diags
+from scipy.sparse.linalg import eigsh
 import pandas as pd
 
 class WaveguideModeSolver:
@@ -12,24 +16,41 @@ class WaveguideModeSolver:
         self.dy = 0.01
         
     def create_index_profile(self, simulation_size=2.0):
+        x = np.arange(-simulation_size / 2, simulation_size / 2, self.dx)
+        y = np.arange(-simulation_size / 2, simulation_size / 2, self.dy)
+        X, Y = np.meshgrid(x, y)
+        
+        core = (np.abs(X) <= self.width / 2) & (np.abs(Y) <= self.height / 2)
+        n_profile = np.where(core, self.n_core, self.n_clad)
+        
+        return x, y, n_profile
+    
+    def solve_modes(self, num_modes=4):
         simulation_size = max(self.width, self.height) * 3
         x, y, n_profile = self.create_index_profile(simulation_size)
         
-        nx, ny = n_profile.shape
+        ny, nx = n_profile.shape
         k0 = 2 * np.pi / self.wavelength
         
-        diag_main = (n_profile.flatten()**2 * k0**2 - 
+        diag_main = (n_profile.ravel()**2 * k0**2 - 
                      2/self.dx**2 - 2/self.dy**2)
         
-        diag_x = np.ones(nx * ny) / self.dx**2
-        diag_y = np.ones(nx * ny) / self.dy**2
+        diag_x = np.full(nx * ny - 1, 1 / self.dx**2)
+        diag_x[nx-1::nx] = 0
+        diag_y = np.full(nx * ny - nx, 1 / self.dy**2)
         
         A = diags([diag_main, diag_x, diag_x, diag_y, diag_y], 
-                  [0, 1, -1, nx, -nx])
+                  [0, 1, -1, nx, -nx], format='csr')
         
         print("Solving for waveguide modes...")
         print("Note: For production, use dedicated mode solver like Lumerical MODE")
         
+        beta_squared, _ = eigsh(A, k=num_modes, sigma=(self.n_core * k0)**2, which='LM')
+        n_effs = np.sort(np.sqrt(np.maximum(beta_squared, 0)) / k0)[::-1]
+        self.effective_indices = n_effs[n_effs > self.n_clad]
+        for i, n_eff in enumerate(self.effective_indices):
+            print(f"  Mode {i}: n_eff = {n_eff:.4f}")
+        
         return self.analytical_mode_cutoff()
     
     def analytical_mode_cutoff(self):
@@ -69,6 +90,8 @@ class WaveguideModeSolver:
         
         plt.tight_layout()
         plt.savefig('waveguide_mode_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        if os.environ.get('PHCEP_SHOW'):
+            plt.show()
+        plt.close()
 
 def validate_single_mode_operation():
@@ -1,42 +1,60 @@
 
+import os
 import numpy as np
 import pandas as pd
+import matplotlib
+if not os.environ.get('PHCEP_SHOW'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-from scipy import stats
 import argparse
-import os
+import json
+from pathlib import Path
+
+_UM_TO_CM = 1e-4
 
 class CutbackAnalyzer:
     def __init__(self):
         self.results = {}
         
     def load_data(self, csv_file):
-        lengths_cm = df['waveguide_length_um'] / 10000
+        x = df['waveguide_length_um'].to_numpy(dtype=float) * _UM_TO_CM
+        power_dBm = df['transmitted_power_dBm'].to_numpy(dtype=float)
         
         if reference_power is None:
-            reference_power = df['transmitted_power_dBm'].max()
+            reference_power = power_dBm.max()
+        
+        y = reference_power - power_dBm
+        
+        dx = x - x.mean()
+        dy = y - y.mean()
+        Sxx = np.dot(dx, dx)
+        Sxy = np.dot(dx, dy)
+        Syy = np.dot(dy, dy)
         
-        transmission_loss = reference_power - df['transmitted_power_dBm']
+        if Sxx == 0:
+            raise ValueError("Cannot fit propagation loss: all waveguide lengths are identical")
         
-        slope, intercept, r_value, p_value, std_err = stats.linregress(
-            lengths_cm, transmission_loss
-        )
+        slope = Sxy / Sxx
+        intercept = y.mean() - slope * x.mean()
+        r_squared = Sxy * Sxy / (Sxx * Syy) if Syy > 0 else 0.0
+        std_err = np.sqrt(max(Syy - slope * Sxy, 0.0) / ((len(x) - 2) * Sxx)) if len(x) > 2 else 0.0
         
         alpha = slope
         
         results = {
-            'propagation_loss_dB_cm': alpha,
-            'r_squared': r_value**2,
-            'std_error': std_err,
-            'lengths_cm': lengths_cm.tolist(),
-            'measured_loss': transmission_loss.tolist(),
-            'fitted_loss': (slope * lengths_cm + intercept).tolist()
+            'propagation_loss_dB_cm': float(alpha),
+            'r_squared': float(r_squared),
+            'std_error': float(std_err),
+            'lengths_cm': x.tolist(),
+            'measured_loss': y.tolist(),
+            'fitted_loss': (slope * x + intercept).tolist()
         }
         
         return results
     
     def plot_analysis(self, df, results, output_file=None):
         print(f"Analyzing cut-back data: {csv_file}")
+        stem = Path(csv_file).with_suffix('')
         
         df = self.load_data(csv_file)
         print(f"Loaded {len(df)} measurements")
@@ -49,11 +67,13 @@ class CutbackAnalyzer:
         print(f"Standard error: {results['std_error']:.4f}")
         
         if plot:
-            plot_file = csv_file.replace('.csv', '_analysis.png')
+            plot_file = f"{stem}_analysis.png"
             self.plot_analysis(df, results, plot_file)
+            if os.environ.get('PHCEP_SHOW'):
+                plt.show()
+            plt.close('all')
         
-        results_file = csv_file.replace('.csv', '_results.json')
-        import json
+        results_file = f"{stem}_results.json"
         with open(results_file, 'w') as f:
             json.dump(results, f, indent=2)
         print(f"Results saved to {results_file}")
@@ -1,5 +1,10 @@
 
+import os
 import numpy as np
+import pandas as pd
+import matplotlib
+if not os.environ.get('PHCEP_SHOW'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from scipy import integrate
 
@@ -28,20 +33,20 @@ class CorrectedEulerBend:
         }
 
 def analyze_bend_performance():
-    confinements = sorted(set(r['confinement'] for r in results))
-    radii = sorted(set(r['target_radius'] for r in results))
+    df = pd.DataFrame(results)
+    confinements = np.sort(df['confinement'].unique())
+    radii = np.sort(df['target_radius'].unique())
     
-    plt.figure(figsize=(14, 10))
+    fig = plt.figure(figsize=(14, 10))
     
     plt.subplot(2, 2, 1)
     for confinement in [0.05, 0.2, 0.5]:
-        conf_results = [r for r in results if r['confinement'] == confinement]
-        radii_conf = [r['target_radius'] for r in conf_results]
-        circular_losses = [r['circular_loss'] for r in conf_results]
-        euler_losses = [r['euler_loss'] for r in conf_results]
+        conf_results = df[df['confinement'] == confinement]
         
-        plt.semilogy(radii_conf, circular_losses, 'o-', label=f'Circular, Γ={confinement}')
-        plt.semilogy(radii_conf, euler_losses, 's--', label=f'Euler, Γ={confinement}')
+        plt.semilogy(conf_results['target_radius'].to_numpy(), conf_results['circular_loss'].to_numpy(),
+                    'o-', label=f'Circular, Γ={confinement}')
+        plt.semilogy(conf_results['target_radius'].to_numpy(), conf_results['euler_loss'].to_numpy(),
+                    's--', label=f'Euler, Γ={confinement}')
     
     plt.xlabel('Bend Radius (μm)')
     plt.ylabel('Radiation Loss (dB/90°)')
@@ -51,11 +56,10 @@ def analyze_bend_performance():
     
     plt.subplot(2, 2, 2)
     for confinement in [0.05, 0.2, 0.5]:
-        conf_results = [r for r in results if r['confinement'] == confinement]
-        radii_conf = [r['target_radius'] for r in conf_results]
-        improvements = [r['improvement_percent'] for r in conf_results]
+        conf_results = df[df['confinement'] == confinement]
         
-        plt.plot(radii_conf, improvements, 'o-', label=f'Γ={confinement}')
+        plt.plot(conf_results['target_radius'].to_numpy(), conf_results['improvement_percent'].to_numpy(),
+                'o-', label=f'Γ={confinement}')
     
     plt.xlabel('Bend Radius (μm)')
     plt.ylabel('Improvement Over Circular Bend (%)')
@@ -63,15 +67,11 @@ def analyze_bend_performance():
     plt.legend()
     plt.grid(True, alpha=0.3)
     
-    plt.subplot(2, 2, 3)
-    from mpl_toolkits.mplot3d import Axes3D
+    ax = plt.subplot(2, 2, 3, projection='3d')
     
-    fig = plt.figure()
-    ax = fig.add_subplot(111, projection='3d')
-    
-    X = [r['target_radius'] for r in results]
-    Y = [r['confinement'] for r in results]
-    Z = [r['improvement_percent'] for r in results]
+    X = df['target_radius'].to_numpy()
+    Y = df['confinement'].to_numpy()
+    Z = df['improvement_percent'].to_numpy()
     
     scatter = ax.scatter(X, Y, Z, c=Z, cmap='viridis')
     ax.set_xlabel('Bend Radius (μm)')
@@ -80,16 +80,11 @@ def analyze_bend_performance():
     ax.set_title('Euler Bend Improvement Surface')
     
     plt.subplot(2, 2, 4)
-    critical_radii = []
-    confinements_sorted = sorted(confinements)
-    
-    for confinement in confinements_sorted:
-        conf_results = [r for r in results if r['confinement'] == confinement]
-        low_loss_radii = [r['target_radius'] for r in conf_results if r['circular_loss'] < 0.5]
-        critical_radius = min(low_loss_radii) if low_loss_radii else max([r['target_radius'] for r in conf_results])
-        critical_radii.append(critical_radius)
+    by_confinement = df.groupby('confinement')['target_radius']
+    low_loss_radii = df[df['circular_loss'] < 0.5].groupby('confinement')['target_radius'].min()
+    critical_radii = low_loss_radii.reindex(confinements).fillna(by_confinement.max())
     
-    plt.plot(confinements_sorted, critical_radii, 'ro-', linewidth=2)
+    plt.plot(confinements, critical_radii.to_numpy(), 'ro-', linewidth=2)
     plt.xlabel('Confinement Factor')
     plt.ylabel('Critical Radius (μm)')
     plt.title('Minimum Radius for < 0.5 dB Loss (Circular)')
@@ -97,6 +92,8 @@ def analyze_bend_performance():
     
     plt.tight_layout()
     plt.savefig('corrected_euler_bend_analysis.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if os.environ.get('PHCEP_SHOW'):
+        plt.show()
+    plt.close(fig)
 
 def main():
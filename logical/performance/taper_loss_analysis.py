@@ -1,16 +1,24 @@
 
+import os
 import numpy as np
 import pandas as pd
+import matplotlib
+if not os.environ.get('PHCEP_SHOW'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import argparse
+import json
+from pathlib import Path
 
 class TaperAnalyzer:
     def __init__(self):
         self.results = {}
     
     def load_taper_data(self, reference_csv, taper_csv):
-        merged = pd.merge(ref_df, taper_df, on='wavelength_nm', 
-                         suffixes=('_ref', '_taper'))
+        ref_df = ref_df.sort_values('wavelength_nm', kind='stable')
+        taper_df = taper_df.sort_values('wavelength_nm', kind='stable')
+        merged = pd.merge(ref_df, taper_df, on='wavelength_nm', how='inner', sort=False,
+                         validate='one_to_one', suffixes=('_ref', '_taper'))
         
         if wavelength_range:
             wl_min, wl_max = wavelength_range
@@ -18,29 +26,32 @@ class TaperAnalyzer:
                           (merged['wavelength_nm'] <= wl_max)]
         
         if 'power_dBm_ref' in merged.columns and 'power_dBm_taper' in merged.columns:
-            merged['insertion_loss_dB'] = merged['power_dBm_ref'] - merged['power_dBm_taper']
+            merged['insertion_loss_dB'] = merged['power_dBm_ref'].to_numpy() - merged['power_dBm_taper'].to_numpy()
         else:
             power_cols_ref = [col for col in merged.columns if 'power' in col.lower() and 'ref' in col]
             power_cols_taper = [col for col in merged.columns if 'power' in col.lower() and 'taper' in col]
             
             if power_cols_ref and power_cols_taper:
-                merged['insertion_loss_dB'] = merged[power_cols_ref[0]] - merged[power_cols_taper[0]]
+                merged['insertion_loss_dB'] = merged[power_cols_ref[0]].to_numpy() - merged[power_cols_taper[0]].to_numpy()
             else:
                 raise ValueError("Could not find power measurement columns")
         
+        loss_stats = merged['insertion_loss_dB'].agg(['mean', 'min', 'max', 'std'])
+        
         results = {
             'wavelengths': merged['wavelength_nm'].tolist(),
             'insertion_loss': merged['insertion_loss_dB'].tolist(),
-            'mean_insertion_loss': merged['insertion_loss_dB'].mean(),
-            'min_insertion_loss': merged['insertion_loss_dB'].min(),
-            'max_insertion_loss': merged['insertion_loss_dB'].max(),
-            'std_insertion_loss': merged['insertion_loss_dB'].std()
+            'mean_insertion_loss': loss_stats['mean'],
+            'min_insertion_loss': loss_stats['min'],
+            'max_insertion_loss': loss_stats['max'],
+            'std_insertion_loss': loss_stats['std']
         }
         
         return results, merged
     
     def plot_taper_performance(self, results, output_file=None):
         print(f"Analyzing taper: {taper_csv} vs reference: {reference_csv}")
+        stem = Path(taper_csv).with_suffix('')
         
         ref_df, taper_df = self.load_taper_data(reference_csv, taper_csv)
         print(f"Reference data points: {len(ref_df)}")
@@ -54,15 +65,17 @@ class TaperAnalyzer:
         print(f"Maximum insertion loss: {results['max_insertion_loss']:.3f} dB")
         print(f"Standard deviation: {results['std_insertion_loss']:.3f} dB")
         
-        plot_file = taper_csv.replace('.csv', '_analysis.png')
+        plot_file = f"{stem}_analysis.png"
         self.plot_taper_performance(results, plot_file)
+        if os.environ.get('PHCEP_SHOW'):
+            plt.show()
+        plt.close('all')
         
-        results_file = taper_csv.replace('.csv', '_results.json')
-        import json
+        results_file = f"{stem}_results.json"
         with open(results_file, 'w') as f:
             json.dump(results, f, indent=2)
         
-        merged_file = taper_csv.replace('.csv', '_merged.csv')
+        merged_file = f"{stem}_merged.csv"
         merged_data.to_csv(merged_file, index=False)
         
         print(f"Results saved to {results_file}")
@@ -1,7 +1,14 @@
 
+import os
 import numpy as np
+import matplotlib
+if not os.environ.get('PHCEP_SHOW'):
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import math
+import functools
+
+_LN10_OVER_10 = math.log(10) / 10.0
 
 class WaveguideAnalyzer:
     def __init__(self, width=0.5, height=0.22, wavelength=1.55, n_core=3.7, n_clad=1.44):
@@ -10,7 +17,12 @@ class WaveguideAnalyzer:
         self.wavelength = wavelength
         self.n_core = n_core
         self.n_clad = n_clad
+        self._bend_edges = np.array([3, 5, 10, 20], dtype=np.float32)
+        self._bend_offset = np.array([30.0, 5.0, 1.0, 0.1, 0.05], dtype=np.float32)
+        self._bend_slope = np.array([0.0, 5.0, 0.5, 0.1, 0.0], dtype=np.float32)
+        self._bend_pivot = np.array([0, 5, 10, 20, 0], dtype=np.float32)
         
+    @functools.cached_property
     def effective_index_approximation(self):
         delta_n = self.n_core - self.n_clad
         
@@ -31,9 +43,9 @@ class WaveguideAnalyzer:
         total_loss_dB_cm = max(0.1, min(20.0, total_loss_dB_cm))
         
         length_cm = length_mm / 10.0
-        transmission = 10 ** (-total_loss_dB_cm * length_cm / 10.0)
+        transmission = math.exp(-total_loss_dB_cm * length_cm * _LN10_OVER_10)
         
-        n_eff, Gamma = self.effective_index_approximation()
+        n_eff, Gamma = self.effective_index_approximation
         
         return {
             'effective_index': n_eff,
@@ -46,37 +58,28 @@ class WaveguideAnalyzer:
         }
     
     def bending_loss_calculation(self, radius_um):
-        if radius_um >= 20:
-            loss_dB = 0.05
-        elif radius_um >= 10:
-            loss_dB = 0.1 + (20 - radius_um) * 0.1
-        elif radius_um >= 5:
-            loss_dB = 1.0 + (10 - radius_um) * 0.5
-        elif radius_um >= 3:
-            loss_dB = 5.0 + (5 - radius_um) * 5.0
-        else:
-            
-        return max(0.01, loss_dB)
+        radius_um = np.asarray(radius_um, dtype=np.float32)
+        idx = np.searchsorted(self._bend_edges, radius_um, side='right')
+        loss_dB = self._bend_offset[idx] + self._bend_slope[idx] * (self._bend_pivot[idx] - radius_um)
+        loss_dB = np.maximum(0.01, loss_dB)
+        return loss_dB if loss_dB.ndim else float(loss_dB)
     
-    def straight_waveguide_simulation(self, length_mm=8.0):
-        positions = np.linspace(0, length_mm, 100)
+    def straight_waveguide_simulation(self, length_mm=8.0, loss_params=None):
+        positions = np.linspace(0, length_mm, 100, dtype=np.float32)
         
-        loss_params = self.propagation_loss_models(length_mm)
+        if loss_params is None:
+            loss_params = self.propagation_loss_models(length_mm)
         loss_per_mm = loss_params['loss_per_mm']
         
-        power = 10 ** (-loss_per_mm * positions / 10.0)
+        power = np.exp(positions * (-loss_per_mm * _LN10_OVER_10))
         
         return positions, power
     
     def analyze_bending_radius_sweep(self, min_radius=1, max_radius=50, num_points=20):
-        radii = np.linspace(min_radius, max_radius, num_points)
-        bending_losses = []
-        
-        for radius in radii:
-            loss = self.bending_loss_calculation(radius)
-            bending_losses.append(loss)
+        radii = np.linspace(min_radius, max_radius, num_points, dtype=np.float32)
+        bending_losses = self.bending_loss_calculation(radii)
             
-        return radii, np.array(bending_losses)
+        return radii, bending_losses
 
 def main():
     print("=== Tellurium-doped Silicon Waveguide Analysis ===")
@@ -90,8 +93,8 @@ def main():
     print("-" * 40)
     
     length_mm = 8.0
-    positions, power = analyzer.straight_waveguide_simulation(length_mm=length_mm)
     loss_params = analyzer.propagation_loss_models(length_mm)
+    positions, power = analyzer.straight_waveguide_simulation(length_mm=length_mm, loss_params=loss_params)
     
     print(f"Effective index: {loss_params['effective_index']:.4f}")
     print(f"Confinement factor: {loss_params['confinement_factor']:.4f}")
@@ -112,9 +115,8 @@ def main():
         min_viable_radius = radii[-1]
     
     print(f"Minimum viable bend radius: {min_viable_radius:.1f} μm")
-    print(f"Bending loss at 5μm radius: {analyzer.bending_loss_calculation(5):.3f} dB/90°")
-    print(f"Bending loss at 10μm radius: {analyzer.bending_loss_calculation(10):.3f} dB/90°")
-    print(f"Bending loss at 20μm radius: {analyzer.bending_loss_calculation(20):.3f} dB/90°")
+    for radius, loss in zip((5, 10, 20), analyzer.bending_loss_calculation(np.array([5.0, 10.0, 20.0]))):
+        print(f"Bending loss at {radius}μm radius: {loss:.3f} dB/90°")
     
     print("\n3. PERFORMANCE ASSESSMENT")
     print("-" * 40)
@@ -136,7 +138,7 @@ def main():
     print(f"Propagation Loss: {loss_rating} ({loss_params['total_loss_dB_cm']:.2f} dB/cm)")
     print(f"Bend Performance: {bend_rating} (min viable radius: {min_viable_radius:.1f} μm)")
     
-    plt.figure(figsize=(15, 5))
+    fig = plt.figure(figsize=(15, 5))
     
     plt.subplot(1, 3, 1)
     plt.plot(positions, power * 100)
@@ -164,7 +166,9 @@ def main():
     
     plt.tight_layout()
     plt.savefig('waveguide_analysis.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if os.environ.get('PHCEP_SHOW'):
+        plt.show()
+    plt.close(fig)
     
     print(f"\n4. DESIGN RECOMMENDATIONS")
     print("-" * 40)
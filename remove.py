@@ -1,38 +1,37 @@
 # remove.py
 import sys
 import os
+import shutil
+import tempfile
 
 def remove_comments_and_mdash(file_path):
-    with open(file_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    clean_lines = []
     inside_triple = False
     removed_count = 0
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Toggle triple-quote blocks
-        if '"""' in stripped:
-            inside_triple = not inside_triple
-            removed_count += 1
-            continue
-
-        # Skip lines inside triple-quote block
-        if inside_triple:
-            removed_count += 1
-            continue
-
-        # Skip lines with # or m-dash (—)
-        if "#" in stripped or "—" in stripped:
-            removed_count += 1
-            continue
-
-        clean_lines.append(line)
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.writelines(clean_lines)
+    with open(file_path, "r", encoding="utf-8", newline="") as f_in, \
+            tempfile.NamedTemporaryFile("w", encoding="utf-8", newline="", delete=False,
+                                        dir=os.path.dirname(os.path.abspath(file_path))) as tmp:
+        for line in f_in:
+            # Toggle triple-quote blocks
+            if '"""' in line:
+                inside_triple = not inside_triple
+                removed_count += 1
+                continue
+
+            # Skip lines inside triple-quote block
+            if inside_triple:
+                removed_count += 1
+                continue
+
+            # Skip lines with # or m-dash (—)
+            if "#" in line or "—" in line:
+                removed_count += 1
+                continue
+
+            tmp.write(line)
+
+    shutil.copymode(file_path, tmp.name)
+    os.replace(tmp.name, file_path)
 
     print(f"🧹 Cleaned {file_path}: removed {removed_count} lines.")
 